@@ -60,7 +60,9 @@ __all__ = [
 ]
 
 from pathlib import Path
+from typing import TYPE_CHECKING
 import os.path as path
+import sys
 import time
 import warnings
 
@@ -69,7 +71,8 @@ from pygame import mixer
 from pygame import vernum as pygame_version
 
 from pygame_menu._base import Base
-from pygame_menu._types import NumberType, Dict, Any, Optional, Union, NumberInstance
+from pygame_menu._types import NumberType, Dict, Any, Optional, Union, NumberInstance, List, \
+    Tuple
 
 try:  # pygame<2.0.0 compatibility
     from pygame import AUDIO_ALLOW_CHANNELS_CHANGE
@@ -93,26 +96,143 @@ SOUND_TYPES = (SOUND_TYPE_CLICK_MOUSE, SOUND_TYPE_CLOSE_MENU, SOUND_TYPE_ERROR,
                SOUND_TYPE_EVENT_ERROR, SOUND_TYPE_KEY_ADDITION, SOUND_TYPE_KEY_DELETION,
                SOUND_TYPE_OPEN_MENU, SOUND_TYPE_WIDGET_SELECTION)
 
+# Index of each sound type within the sound engine data
+_SOUND_INDEX = {sound_type: index for index, sound_type in enumerate(SOUND_TYPES)}
+_SOUND_INDEX_CLICK_MOUSE = _SOUND_INDEX[SOUND_TYPE_CLICK_MOUSE]
+_SOUND_INDEX_CLOSE_MENU = _SOUND_INDEX[SOUND_TYPE_CLOSE_MENU]
+_SOUND_INDEX_ERROR = _SOUND_INDEX[SOUND_TYPE_ERROR]
+_SOUND_INDEX_EVENT = _SOUND_INDEX[SOUND_TYPE_EVENT]
+_SOUND_INDEX_EVENT_ERROR = _SOUND_INDEX[SOUND_TYPE_EVENT_ERROR]
+_SOUND_INDEX_KEY_ADDITION = _SOUND_INDEX[SOUND_TYPE_KEY_ADDITION]
+_SOUND_INDEX_KEY_DELETION = _SOUND_INDEX[SOUND_TYPE_KEY_DELETION]
+_SOUND_INDEX_OPEN_MENU = _SOUND_INDEX[SOUND_TYPE_OPEN_MENU]
+_SOUND_INDEX_WIDGET_SELECTION = _SOUND_INDEX[SOUND_TYPE_WIDGET_SELECTION]
+
+# Sound data shared by the engines without any sound set
+_SOUND_NO_DATA = (None,) * len(SOUND_TYPES)
+
 # Sound example paths
 __sounds_path__ = path.join(path.dirname(path.abspath(__file__)), 'resources', 'sounds', '{0}')
 
-SOUND_EXAMPLE_CLICK_MOUSE = __sounds_path__.format('click_mouse.ogg')
-SOUND_EXAMPLE_CLOSE_MENU = __sounds_path__.format('close_menu.ogg')
-SOUND_EXAMPLE_ERROR = __sounds_path__.format('error.ogg')
-SOUND_EXAMPLE_EVENT = __sounds_path__.format('event.ogg')
-SOUND_EXAMPLE_EVENT_ERROR = __sounds_path__.format('event_error.ogg')
-SOUND_EXAMPLE_KEY_ADD = __sounds_path__.format('key_add.ogg')
-SOUND_EXAMPLE_KEY_DELETE = __sounds_path__.format('key_delete.ogg')
-SOUND_EXAMPLE_OPEN_MENU = __sounds_path__.format('open_menu.ogg')
-SOUND_EXAMPLE_WIDGET_SELECTION = __sounds_path__.format('widget_selection.ogg')
+# Sound example files, in the same order as the sound types. The paths are
+# resolved on first access by the module __getattr__
+_SOUND_EXAMPLE_FILES = {
+    'SOUND_EXAMPLE_CLICK_MOUSE': 'click_mouse.ogg',
+    'SOUND_EXAMPLE_CLOSE_MENU': 'close_menu.ogg',
+    'SOUND_EXAMPLE_ERROR': 'error.ogg',
+    'SOUND_EXAMPLE_EVENT': 'event.ogg',
+    'SOUND_EXAMPLE_EVENT_ERROR': 'event_error.ogg',
+    'SOUND_EXAMPLE_KEY_ADD': 'key_add.ogg',
+    'SOUND_EXAMPLE_KEY_DELETE': 'key_delete.ogg',
+    'SOUND_EXAMPLE_OPEN_MENU': 'open_menu.ogg',
+    'SOUND_EXAMPLE_WIDGET_SELECTION': 'widget_selection.ogg'
+}
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Return the sound example paths, these are computed and stored on first access.
+
+    :param name: Attribute name
+    :return: Attribute value
+    """
+    module = globals()
+    if name in _SOUND_EXAMPLE_FILES:
+        module[name] = __sounds_path__.format(_SOUND_EXAMPLE_FILES[name])
+    elif name == 'SOUND_EXAMPLES':
+        module[name] = tuple(module[example] if example in module else __getattr__(example)
+                             for example in _SOUND_EXAMPLE_FILES)
+    else:
+        raise AttributeError('module {0!r} has no attribute {1!r}'.format(__name__, name))
+    return module[name]
+
+
+# Module __getattr__ is only supported on python>=3.7
+if sys.version_info < (3, 7):
+    __getattr__('SOUND_EXAMPLES')
+
+# Declare the sound example paths for static analysis, these are resolved by __getattr__
+if TYPE_CHECKING:
+    SOUND_EXAMPLE_CLICK_MOUSE: str
+    SOUND_EXAMPLE_CLOSE_MENU: str
+    SOUND_EXAMPLE_ERROR: str
+    SOUND_EXAMPLE_EVENT: str
+    SOUND_EXAMPLE_EVENT_ERROR: str
+    SOUND_EXAMPLE_KEY_ADD: str
+    SOUND_EXAMPLE_KEY_DELETE: str
+    SOUND_EXAMPLE_OPEN_MENU: str
+    SOUND_EXAMPLE_WIDGET_SELECTION: str
+    SOUND_EXAMPLES: Tuple[str, ...]
+
+# Bound functions used within the sound engine
+_mixer_find_channel = mixer.find_channel
+_path_isfile = path.isfile
+_time_time = time.time
+
+# Mixer init method, the arguments passed to mixer.init depend on the pygame
+# version, thus, the version is checked only once
+_version_major, _, _version_minor = pygame_version
+
+if _version_major == 1 and _version_minor <= 4:  # <= 1.9.4
+    # noinspection PyUnusedLocal
+    def _mixer_init(frequency: int, size: int, channels: int, buffer: int,
+                    devicename: str, allowedchanges: int) -> None:
+        mixer.init(frequency=frequency,
+                   size=size,
+                   channels=channels,
+                   buffer=buffer)
+
+elif _version_major == 1 and _version_minor > 4:  # <2.0.0 & >= 1.9.5  lgtm [py/redundant-comparison]
+    # noinspection PyUnusedLocal
+    def _mixer_init(frequency: int, size: int, channels: int, buffer: int,
+                    devicename: str, allowedchanges: int) -> None:
+        mixer.init(frequency=frequency,
+                   size=size,
+                   channels=channels,
+                   buffer=buffer,
+                   devicename=devicename)
+
+else:  # >= 2.0.0
+    def _mixer_init(frequency: int, size: int, channels: int, buffer: int,
+                    devicename: str, allowedchanges: int) -> None:
+        mixer.init(frequency=frequency,
+                   size=size,
+                   channels=channels,
+                   buffer=buffer,
+                   devicename=devicename,
+                   allowedchanges=allowedchanges)
+
+
+def _should_play(
+        now: float,
+        last_time: float,
+        last_index: int,
+        index: int,
+        min_interval: float,
+        unique: bool
+) -> bool:
+    """
+    Check if a sound should be played. A sound is not played if the previous
+    sound is the same and has not ended (max 10% overlap), unless the channel
+    is unique.
+
+    :param now: Current time
+    :param last_time: Time of the last played sound
+    :param last_index: Index of the last played sound
+    :param index: Index of the sound to be played
+    :param min_interval: Min interval between two plays of the same sound
+    :param unique: If ``True`` the sound is played on a unique channel
+    :return: ``True`` if the sound should be played
+    """
+    return index != last_index or now - last_time >= min_interval or unique
 
-SOUND_EXAMPLES = (SOUND_EXAMPLE_CLICK_MOUSE, SOUND_EXAMPLE_CLOSE_MENU, SOUND_EXAMPLE_ERROR,
-                  SOUND_EXAMPLE_EVENT, SOUND_EXAMPLE_EVENT_ERROR, SOUND_EXAMPLE_KEY_ADD,
-                  SOUND_EXAMPLE_KEY_DELETE, SOUND_EXAMPLE_OPEN_MENU, SOUND_EXAMPLE_WIDGET_SELECTION)
 
 # Stores global reference that marks sounds as initialized
 SOUND_INITIALIZED = [False]
 
+# Stores the index and the mixer channel shared by the unique channel engines
+_SOUND_UNIQUE_CHANNEL = [-1, None]
+
 
 class Sound(Base):
     """
@@ -129,11 +249,17 @@ class Sound(Base):
     :param uniquechannel: Force the channel to be unique, this is set at the object creation moment
     """
     _channel: Optional['mixer.Channel']
-    _last_play: str
+    _fade_ms: Union[Tuple[None, ...], List[NumberType]]
+    _files: Union[Tuple[None, ...], List[Optional['mixer.Sound']]]
+    _last_index: int
     _last_time: float
+    _loops: Union[Tuple[None, ...], List[int]]
+    _maxtime: Union[Tuple[None, ...], List[NumberType]]
+    _min_interval: Union[Tuple[None, ...], List[float]]
     _mixer_configs: Dict[str, Union[bool, int, str]]
-    _sound: Dict[str, Dict[str, Any]]
+    _paths: Union[Tuple[None, ...], List[Optional[str]]]
     _uniquechannel: bool
+    _volumes: Union[Tuple[None, ...], List[float]]
 
     def __init__(
             self,
@@ -168,35 +294,9 @@ class Sound(Base):
             # Set sound as initialized globally
             SOUND_INITIALIZED[0] = True
 
-            # Check pygame version
-            version_major, _, version_minor = pygame_version
-
             # noinspection PyBroadException
             try:
-                # <= 1.9.4
-                if version_major == 1 and version_minor <= 4:
-                    mixer.init(frequency=frequency,
-                               size=size,
-                               channels=channels,
-                               buffer=buffer)
-
-                # <2.0.0 & >= 1.9.5
-                elif version_major == 1 and version_minor > 4:  # lgtm [py/redundant-comparison]
-                    mixer.init(frequency=frequency,
-                               size=size,
-                               channels=channels,
-                               buffer=buffer,
-                               devicename=devicename)
-
-                # >= 2.0.0
-                elif version_major > 1:
-                    mixer.init(frequency=frequency,
-                               size=size,
-                               channels=channels,
-                               buffer=buffer,
-                               devicename=devicename,
-                               allowedchanges=allowedchanges)
-
+                _mixer_init(frequency, size, channels, buffer, devicename, allowedchanges)
             except Exception as e:
                 msg = 'sound error: ' + str(e)
                 warnings.warn(msg)
@@ -218,13 +318,15 @@ class Sound(Base):
         self._channel = None
         self._uniquechannel = uniquechannel
 
-        # Sound dict
-        self._sound = {}
-        for sound in SOUND_TYPES:
-            self._sound[sound] = {}
+        # Sound data, each list is indexed by the sound type index. If the
+        # sound file is None the sound type is disabled. Most engines never
+        # load a sound (each widget creates one), thus, the engines share the
+        # _SOUND_NO_DATA tuple until the first sound is set
+        self._fade_ms = self._files = self._loops = self._maxtime = self._min_interval = \
+            self._paths = self._volumes = _SOUND_NO_DATA
 
         # Last played song
-        self._last_play = ''
+        self._last_index = -1
         self._last_time = 0
 
     def copy(self) -> 'Sound':
@@ -237,16 +339,15 @@ class Sound(Base):
         new_sound._channel = self._channel
         for key in self._mixer_configs:
             new_sound._mixer_configs[key] = self._mixer_configs[key]
-        for sound_type in self._sound.keys():
-            s = self._sound[sound_type]
-            if len(s) != 0:
+        for index, sound_type in enumerate(SOUND_TYPES):
+            if self._files[index] is not None:
                 new_sound.set_sound(
                     sound_type=sound_type,
-                    sound_file=s['path'],
-                    volume=s['volume'],
-                    loops=s['loops'],
-                    maxtime=s['maxtime'],
-                    fade_ms=s['fade_ms']
+                    sound_file=self._paths[index],
+                    volume=self._volumes[index],
+                    loops=self._loops[index],
+                    maxtime=self._maxtime[index],
+                    fade_ms=self._fade_ms[index]
                 )
         return new_sound
 
@@ -273,15 +374,43 @@ class Sound(Base):
 
         :return: Sound engine channel
         """
-        # noinspection PyArgumentList
-        channel = mixer.find_channel()  # force only available on pygame v2
         if self._uniquechannel:  # If the channel is unique
-            if self._channel is None:  # If the channel has not been set
-                self._channel = channel
-        else:
-            self._channel = channel  # Store the available channel
+            if self._channel is None:  # Use the unique channel if it has been created
+                self._channel = self._get_unique_channel(create=False)
+            return self._channel
+        # noinspection PyArgumentList
+        self._channel = _mixer_find_channel()  # force only available on pygame v2
         return self._channel
 
+    @staticmethod
+    def _get_unique_channel(create: bool) -> Optional['mixer.Channel']:
+        """
+        Return the mixer channel shared by all the unique channel engines. The
+        channel is added after the existing ones, thus, the channels reserved by
+        the application are kept. The channel is not reserved, so other sounds
+        of the application may use it while it's idle and every other channel is
+        busy. The channel is added again if the mixer was re-initialized, as
+        using a channel index removed from the mixer crashes pygame.
+
+        :param create: If ``True`` add the channel to the mixer if it does not exist
+        :return: Unique channel, ``None`` if the mixer is not available or the channel was not created
+        """
+        index, channel = _SOUND_UNIQUE_CHANNEL
+        try:
+            num_channels = mixer.get_num_channels()
+            if channel is not None and index < num_channels:
+                return channel
+            if not create:
+                return None
+            index = num_channels
+            mixer.set_num_channels(num_channels + 1)
+            channel = mixer.Channel(index)
+        except (pygame_error, IndexError):
+            return None
+        _SOUND_UNIQUE_CHANNEL[0] = index
+        _SOUND_UNIQUE_CHANNEL[1] = channel
+        return channel
+
     def set_sound(self, sound_type: str, sound_file: Optional[Union[str, 'Path']], volume: float = 0.5,
                   loops: int = 0, maxtime: NumberType = 0, fade_ms: NumberType = 0) -> bool:
         """
@@ -310,14 +439,25 @@ class Sound(Base):
         if sound_type not in SOUND_TYPES:
             raise ValueError('sound type not valid, check the manual')
 
+        # Create the sound data lists
+        if self._files is _SOUND_NO_DATA:
+            self._fade_ms = [0] * len(SOUND_TYPES)
+            self._files = [None] * len(SOUND_TYPES)
+            self._loops = [0] * len(SOUND_TYPES)
+            self._maxtime = [0] * len(SOUND_TYPES)
+            self._min_interval = [0.0] * len(SOUND_TYPES)
+            self._paths = [None] * len(SOUND_TYPES)
+            self._volumes = [0.0] * len(SOUND_TYPES)
+
         # If file is none disable the sound
+        index = _SOUND_INDEX[sound_type]
         if sound_file is None:
-            self._sound[sound_type] = {}
+            self._files[index] = None
             return False
 
         # Check the file exists
         sound_file = str(sound_file)
-        if not path.isfile(sound_file):
+        if not _path_isfile(sound_file):
             raise IOError('sound file "{0}" does not exist'.format(sound_file))
 
         # Load the sound
@@ -327,23 +467,20 @@ class Sound(Base):
         except pygame_error:
             msg = 'the sound file "{0}" could not be loaded, it has been disabled'.format(sound_file)
             warnings.warn(msg)
-            self._sound[sound_type] = {}
+            self._files[index] = None
             return False
 
         # Configure the sound
         sound_data.set_volume(float(volume))
 
-        # Store the sound
-        self._sound[sound_type] = {
-            'fade_ms': fade_ms,
-            'file': sound_data,
-            'length': sound_data.get_length(),
-            'loops': loops,
-            'maxtime': maxtime,
-            'path': sound_file,
-            'type': sound_type,
-            'volume': volume
-        }
+        # Store the sound, the min interval allows a max 10% overlap of the same sound
+        self._fade_ms[index] = fade_ms
+        self._files[index] = sound_data
+        self._loops[index] = loops
+        self._maxtime[index] = maxtime
+        self._min_interval[index] = 0.1 * sound_data.get_length()
+        self._paths[index] = sound_file
+        self._volumes[index] = volume
         return True
 
     def load_example_sounds(self, volume: float = 0.5) -> 'Sound':
@@ -354,44 +491,48 @@ class Sound(Base):
         :return: Self reference
         """
         assert isinstance(volume, NumberInstance) and 0 <= volume <= 1
-        for sound in range(len(SOUND_TYPES)):
-            self.set_sound(SOUND_TYPES[sound], SOUND_EXAMPLES[sound], volume=float(volume))
+        for sound_type, sound_file in zip(SOUND_TYPES, _SOUND_EXAMPLE_FILES.values()):
+            self.set_sound(sound_type, __sounds_path__.format(sound_file), volume=float(volume))
         return self
 
-    def _play_sound(self, sound: Optional[Dict[str, Any]]) -> bool:
+    def _play_sound(self, index: int) -> bool:
         """
         Play a sound.
 
-        :param sound: Sound to be played
+        :param index: Index of the sound type to be played
         :return: ``True`` if the sound was played
         """
-        if not sound:
+        sound = self._files[index]
+        if sound is None:  # The sound type is disabled
             return False
 
-        # Find an available channel
-        channel = self.get_channel()  # This will set the channel if it's None
+        # Find an available channel. The unique channel is checked against the
+        # mixer, which could have been re-initialized, and created on first play
+        if self._uniquechannel:
+            self._channel = self._get_unique_channel(create=True)
+            channel = self._channel
+        else:
+            channel = self.get_channel()  # This will set the channel if it's None
         if channel is None:  # The sound can't be played because all channels are busy
             return False
 
         # Play the sound
-        sound_time = time.time()
+        sound_time = _time_time()
 
-        # If the previous sound is the same and has not ended (max 10% overlap)
-        if sound['type'] != self._last_play or \
-                sound_time - self._last_time >= 0.1 * sound['length'] or self._uniquechannel:
+        if _should_play(sound_time, self._last_time, self._last_index, index,
+                        self._min_interval[index], self._uniquechannel):
             try:
-                if self._uniquechannel:  # Stop the current channel if it's unique
-                    channel.stop()
-                channel.play(sound['file'],
-                             loops=sound['loops'],
-                             maxtime=sound['maxtime'],
-                             fade_ms=sound['fade_ms']
+                # If the channel is unique, play stops the current sound
+                channel.play(sound,
+                             loops=self._loops[index],
+                             maxtime=self._maxtime[index],
+                             fade_ms=self._fade_ms[index]
                              )
             except pygame_error:  # Ignore errors
                 pass
 
         # Store last execution
-        self._last_play = sound['type']
+        self._last_index = index
         self._last_time = sound_time
         return True
 
@@ -401,7 +542,7 @@ class Sound(Base):
 
         :return: Self reference
         """
-        self._play_sound(self._sound[SOUND_TYPE_CLICK_MOUSE])
+        self._play_sound(_SOUND_INDEX_CLICK_MOUSE)
         return self
 
     def play_error(self) -> 'Sound':
@@ -410,7 +551,7 @@ class Sound(Base):
 
         :return: Self reference
         """
-        self._play_sound(self._sound[SOUND_TYPE_ERROR])
+        self._play_sound(_SOUND_INDEX_ERROR)
         return self
 
     def play_event(self) -> 'Sound':
@@ -419,7 +560,7 @@ class Sound(Base):
 
         :return: Self reference
         """
-        self._play_sound(self._sound[SOUND_TYPE_EVENT])
+        self._play_sound(_SOUND_INDEX_EVENT)
         return self
 
     def play_event_error(self) -> 'Sound':
@@ -428,7 +569,7 @@ class Sound(Base):
 
         :return: Self reference
         """
-        self._play_sound(self._sound[SOUND_TYPE_EVENT_ERROR])
+        self._play_sound(_SOUND_INDEX_EVENT_ERROR)
         return self
 
     def play_key_add(self) -> 'Sound':
@@ -437,7 +578,7 @@ class Sound(Base):
 
         :return: Self reference
         """
-        self._play_sound(self._sound[SOUND_TYPE_KEY_ADDITION])
+        self._play_sound(_SOUND_INDEX_KEY_ADDITION)
         return self
 
     def play_key_del(self) -> 'Sound':
@@ -446,7 +587,7 @@ class Sound(Base):
 
         :return: Self reference
         """
-        self._play_sound(self._sound[SOUND_TYPE_KEY_DELETION])
+        self._play_sound(_SOUND_INDEX_KEY_DELETION)
         return self
 
     def play_open_menu(self) -> 'Sound':
@@ -455,7 +596,7 @@ class Sound(Base):
 
         :return: Self reference
         """
-        self._play_sound(self._sound[SOUND_TYPE_OPEN_MENU])
+        self._play_sound(_SOUND_INDEX_OPEN_MENU)
         return self
 
     def play_close_menu(self) -> 'Sound':
@@ -464,7 +605,7 @@ class Sound(Base):
 
         :return: Self reference
         """
-        self._play_sound(self._sound[SOUND_TYPE_CLOSE_MENU])
+        self._play_sound(_SOUND_INDEX_CLOSE_MENU)
         return self
 
     def play_widget_selection(self) -> 'Sound':
@@ -473,7 +614,7 @@ class Sound(Base):
 
         :return: Self reference
         """
-        self._play_sound(self._sound[SOUND_TYPE_WIDGET_SELECTION])
+        self._play_sound(_SOUND_INDEX_WIDGET_SELECTION)
         return self
 
     def stop(self) -> 'Sound':
@@ -527,7 +668,11 @@ class Sound(Base):
 
         :return: Information dict e.g.: ``{'busy': 0, 'endevent': 0, 'queue': None, 'sound': None, 'volume': 1.0}``
         """
-        channel = self.get_channel()
+        if self._uniquechannel:  # The channel could have been removed by a mixer re-init
+            self._channel = self._get_unique_channel(create=False)
+            channel = self._channel
+        else:
+            channel = self.get_channel()
         data = {}
         if channel is None:  # The sound can't be played because all channels are busy
             return data
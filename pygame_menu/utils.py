@@ -77,6 +77,23 @@ from pygame_menu._types import ColorType, ColorInputType, Union, List, Vector2Nu
 
 PYGAME_V2 = pygame.version.vernum[0] >= 2
 
+# Valid values of the assert methods
+_VALID_ALIGNMENTS = frozenset((ALIGN_LEFT, ALIGN_CENTER, ALIGN_RIGHT))
+_VALID_ORIENTATIONS = frozenset((ORIENTATION_HORIZONTAL, ORIENTATION_VERTICAL))
+_VALID_POSITIONS = frozenset((POSITION_WEST, POSITION_SOUTHWEST, POSITION_SOUTH, POSITION_SOUTHEAST, POSITION_EAST,
+                              POSITION_NORTH, POSITION_NORTHWEST, POSITION_NORTHEAST, POSITION_CENTER))
+
+# Numeric types of the vectors
+_NUMERIC_TYPES = frozenset(NumberInstance)
+
+# Function types accepted as callables
+_CALLABLE_TYPES = (types.FunctionType, types.BuiltinFunctionType, types.MethodType, functools.partial)
+
+# Bound pygame objects used by the surface creation
+_Surface = pygame.Surface
+_SRCALPHA = pygame.SRCALPHA
+_display_get_surface = pygame.display.get_surface
+
 
 def assert_alignment(align: str) -> None:
     """
@@ -86,7 +103,7 @@ def assert_alignment(align: str) -> None:
     :return: None
     """
     assert isinstance(align, str), 'alignment "{0}" must be a string'.format(align)
-    assert align in (ALIGN_LEFT, ALIGN_CENTER, ALIGN_RIGHT), \
+    assert align in _VALID_ALIGNMENTS, \
         'incorrect alignment value "{0}"'.format(align)
 
 
@@ -102,21 +119,28 @@ def assert_color(
     :return: Formatted color if valid, else, throws an ``AssertionError`` exception
     """
     color = format_color(color, warn_if_invalid=warn_if_invalid)
+    if not __debug__:
+        return color
     assert isinstance(color, VectorInstance), \
         'color must be a tuple or list, not type "{0}"'.format(type(color))
     assert 4 >= len(color) >= 3, \
         'color must be a tuple or list of 3 or 4 numbers'
-    for i in range(3):
-        assert isinstance(color[i], int), \
-            '"{0}" in element color {1} must be an integer, not type "{2}"'.format(color[i], color, type(color))
-        assert 0 <= color[i] <= 255, \
-            '"{0}" in element color {1} must be an integer between 0 and 255'.format(color[i], color)
+    r, g, b = color[0], color[1], color[2]
+    if not (type(r) is int and type(g) is int and type(b) is int and
+            0 <= r <= 255 and 0 <= g <= 255 and 0 <= b <= 255):
+        for c in (r, g, b):  # Find the invalid element
+            assert isinstance(c, int), \
+                '"{0}" in element color {1} must be an integer, not type "{2}"'.format(c, color, type(c))
+            assert 0 <= c <= 255, \
+                '"{0}" in element color {1} must be an integer between 0 and 255'.format(c, color)
     if len(color) == 4:
-        assert isinstance(color[3], int), \
-            'alpha channel must be an integer between 0 and 255, not type "{0}"'.format(type(color))
-        assert 0 <= color[3] <= 255, \
-            'opacity of color {0} must be an integer between 0 and 255; where ' \
-            '0 is fully-transparent and 255 is fully-opaque'.format(color)
+        a = color[3]
+        if not (type(a) is int and 0 <= a <= 255):
+            assert isinstance(a, int), \
+                'alpha channel must be an integer between 0 and 255, not type "{0}"'.format(type(a))
+            assert 0 <= a <= 255, \
+                'opacity of color {0} must be an integer between 0 and 255; where ' \
+                '0 is fully-transparent and 255 is fully-opaque'.format(color)
     return color
 
 
@@ -140,6 +164,8 @@ def assert_list_vector(list_vector: Union[List[Vector2NumberType], Tuple[Vector2
     :param length: Length of the required vector. If ``0`` don't check the length
     :return: None
     """
+    if not __debug__:
+        return
     assert isinstance(list_vector, (tuple, list)), \
         'list_vector "{0}" must be a tuple or list'.format(list_vector)
     for v in list_vector:
@@ -155,7 +181,7 @@ def assert_orientation(orientation: str) -> None:
     """
     assert isinstance(orientation, str), \
         'orientation "{0}" must be a string'.format(orientation)
-    assert orientation in [ORIENTATION_HORIZONTAL, ORIENTATION_VERTICAL], \
+    assert orientation in _VALID_ORIENTATIONS, \
         'invalid orientation value "{0}"'.format(orientation)
 
 
@@ -168,8 +194,7 @@ def assert_position(position: str) -> None:
     """
     assert isinstance(position, str), \
         'position "{0}" must be a string'.format(position)
-    assert position in [POSITION_WEST, POSITION_SOUTHWEST, POSITION_SOUTH, POSITION_SOUTHEAST, POSITION_EAST,
-                        POSITION_NORTH, POSITION_NORTHWEST, POSITION_NORTHEAST, POSITION_CENTER], \
+    assert position in _VALID_POSITIONS, \
         'invalid position value "{0}"'.format(position)
 
 
@@ -182,14 +207,20 @@ def assert_vector(num_vector: VectorType, length: int, instance: type = NumberIn
     :param instance: Instance of each item of the vector
     :return: None
     """
+    if not __debug__:
+        return
     assert isinstance(num_vector, VectorInstance), \
         'vector "{0}" must be a list or tuple of {1} items if type {2}'.format(num_vector, length, instance)
     if length != 0:
-        msg = 'vector "{0}" must contain {1} numbers only, ' \
-              'but {2} were given'.format(num_vector, length, len(num_vector))
-        assert len(num_vector) == length, msg
-    for i in range(len(num_vector)):
-        num = num_vector[i]
+        assert len(num_vector) == length, \
+            'vector "{0}" must contain {1} numbers only, ' \
+            'but {2} were given'.format(num_vector, length, len(num_vector))
+    if instance is NumberInstance:  # Exact type check avoids the isinstance call on most vectors
+        for num in num_vector:
+            assert type(num) in _NUMERIC_TYPES or isinstance(num, instance), \
+                'item {0} of vector must be {1}, not type "{2}"'.format(num, instance, type(num))
+        return
+    for num in num_vector:
         if instance == int and isinstance(num, float) and int(num) == num:
             num = int(num)
         assert isinstance(num, instance), \
@@ -206,12 +237,11 @@ def check_key_pressed_valid(event: EventType) -> bool:
     # If the system detects that any key event has been pressed but
     # there's not any key pressed then this method raises a KEYUP
     # flag
-    bad_event = not (True in pygame.key.get_pressed())
+    bad_event = not any(pygame.key.get_pressed())
     if bad_event:
         if 'test' in event.dict and event.dict['test']:
             return True
-        ev = pygame.event.Event(pygame.KEYUP, {'key': event.key})
-        pygame.event.post(ev)
+        pygame.event.post(pygame.event.Event(pygame.KEYUP, key=event.key))
     return not bad_event
 
 
@@ -338,8 +368,7 @@ def is_callable(func: Any) -> bool:
     :return: ``True`` if function
     """
     # noinspection PyTypeChecker
-    return isinstance(func, (types.FunctionType, types.BuiltinFunctionType,
-                             types.MethodType, functools.partial))
+    return isinstance(func, _CALLABLE_TYPES)
 
 
 def make_surface(width: NumberType, height: NumberType,
@@ -358,10 +387,10 @@ def make_surface(width: NumberType, height: NumberType,
     assert isinstance(alpha, bool)
     assert width >= 0 and height >= 0, \
         'surface width and height must be equal or greater than zero'
-    surface = pygame.Surface((int(width), int(height)), pygame.SRCALPHA, 32)  # lgtm [py/call/wrong-arguments]
-    if alpha:
+    surface = _Surface((int(width), int(height)), _SRCALPHA, 32)  # lgtm [py/call/wrong-arguments]
+    if alpha and _display_get_surface() is not None:
         # noinspection PyArgumentList
-        surface = pygame.Surface.convert_alpha(surface)
+        surface = surface.convert_alpha()
     if fill_color is not None:
         fill_color = assert_color(fill_color)
         surface.fill(fill_color)
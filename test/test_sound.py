@@ -35,8 +35,11 @@ from test._utils import MenuUtils
 import copy
 import unittest
 
+import pygame
 import pygame_menu
 
+from pygame import mixer
+
 
 class SoundTest(unittest.TestCase):
 
@@ -57,9 +60,9 @@ class SoundTest(unittest.TestCase):
         sound_deep = copy.deepcopy(sound_src)
 
         # Check if sounds are different
-        t = pygame_menu.sound.SOUND_TYPE_CLICK_MOUSE
-        self.assertNotEqual(sound_src._sound[t]['file'], sound._sound[t]['file'])
-        self.assertNotEqual(sound_src._sound[t]['file'], sound_deep._sound[t]['file'])
+        t = pygame_menu.sound._SOUND_INDEX[pygame_menu.sound.SOUND_TYPE_CLICK_MOUSE]
+        self.assertNotEqual(sound_src._files[t], sound._files[t])
+        self.assertNotEqual(sound_src._files[t], sound_deep._files[t])
 
     def test_none_channel(self) -> None:
         """
@@ -86,21 +89,87 @@ class SoundTest(unittest.TestCase):
         self.sound.unpause()
         self.sound.stop()
 
+    def _init_mixer(self) -> None:
+        """
+        Initialize the mixer if required, its state is restored after the test.
+        """
+        init = mixer.get_init()
+        if init is None:
+            try:
+                mixer.init()
+            except pygame.error as e:
+                self.skipTest('mixer could not be initialized: {0}'.format(e))
+            self.addCleanup(mixer.quit)
+            return
+        num_channels = mixer.get_num_channels()
+
+        def restore() -> None:
+            """
+            Restore the mixer state.
+            """
+            mixer.quit()
+            mixer.init(frequency=init[0], size=init[1], channels=init[2])
+            mixer.set_num_channels(num_channels)
+
+        self.addCleanup(restore)
+
+    def test_unique_channel(self) -> None:
+        """
+        Test the channel shared by the unique channel engines.
+        """
+        self._init_mixer()
+        pygame_menu.sound._SOUND_UNIQUE_CHANNEL[:] = [-1, None]
+        num_channels = mixer.get_num_channels()
+        sounds = [pygame_menu.sound.Sound().load_example_sounds() for _ in range(10)]
+
+        # The channel is only added to the mixer on the first play
+        for sound in sounds:
+            sound.stop()
+            sound.pause()
+            sound.unpause()
+            self.assertEqual(sound.get_channel_info(), {})
+            self.assertIsNone(sound.get_channel())
+        self.assertEqual(mixer.get_num_channels(), num_channels)
+
+        # All unique engines share the same channel, added after the existing ones
+        sounds[0].play_click_mouse()
+        self.assertEqual(mixer.get_num_channels(), num_channels + 1)
+        self.assertEqual(pygame_menu.sound._SOUND_UNIQUE_CHANNEL[0], num_channels)
+        channel = sounds[0].get_channel()
+        for sound in sounds:
+            sound.play_error()
+            self.assertIs(sound.get_channel(), channel)
+            self.assertEqual(len(sound.get_channel_info()), 5)
+        self.assertEqual(mixer.get_num_channels(), num_channels + 1)
+
+        # The channel is added again if the mixer is re-initialized
+        mixer.quit()
+        mixer.init()
+        self.assertEqual(sounds[0].get_channel_info(), {})
+        sounds[0].load_example_sounds().play_click_mouse()
+        self.assertEqual(pygame_menu.sound._SOUND_UNIQUE_CHANNEL[0], mixer.get_num_channels() - 1)
+        self.assertIsNot(sounds[0].get_channel(), channel)
+
     def test_load_sound(self) -> None:
         """
         Test load sounds.
         """
+        self.assertEqual(self.sound._files, pygame_menu.sound._SOUND_NO_DATA)  # Data is created on first load
         self.assertFalse(self.sound.set_sound(pygame_menu.sound.SOUND_TYPE_CLICK_MOUSE, None))
         self.assertRaises(ValueError, lambda: self.sound.set_sound('none', None))
         self.assertRaises(IOError,
                           lambda: self.sound.set_sound(pygame_menu.sound.SOUND_TYPE_CLICK_MOUSE, 'bad_file'))
-        self.assertFalse(self.sound._play_sound(None))
+        self.assertFalse(self.sound._play_sound(pygame_menu.sound._SOUND_INDEX_CLICK_MOUSE))  # Disabled
         self.assertFalse(self.sound.set_sound(pygame_menu.sound.SOUND_TYPE_ERROR, pygame_menu.font.FONT_PT_SERIF))
 
     def test_example_sounds(self) -> None:
         """
         Test example sounds.
         """
+        self.assertEqual(len(pygame_menu.sound.SOUND_EXAMPLES), len(pygame_menu.sound.SOUND_TYPES))
+        self.assertEqual(pygame_menu.sound.SOUND_EXAMPLES[0], pygame_menu.sound.SOUND_EXAMPLE_CLICK_MOUSE)
+        self.assertRaises(AttributeError, lambda: pygame_menu.sound.SOUND_EXAMPLE_INVALID)
+
         self.sound.load_example_sounds()
 
         self.sound.play_click_mouse()
@@ -112,6 +181,33 @@ class SoundTest(unittest.TestCase):
         self.sound.play_key_del()
         self.sound.play_open_menu()
 
+    def test_should_play(self) -> None:
+        """
+        Test the sound play overlap check.
+        """
+        should_play = pygame_menu.sound._should_play
+        self.assertTrue(should_play(1, 0.9, 0, 1, 0.5, False))  # Different sound
+        self.assertFalse(should_play(1, 0.9, 0, 0, 0.5, False))  # Same sound, overlaps
+        self.assertTrue(should_play(1, 0.5, 0, 0, 0.5, False))  # Same sound, ended
+        self.assertTrue(should_play(1, 0.9, 0, 0, 0.5, True))  # Unique channel
+
+    def test_last_play(self) -> None:
+        """
+        Test the last play is stored on every play request.
+        """
+        self._init_mixer()
+        sound = pygame_menu.sound.Sound(uniquechannel=False)
+        sound.load_example_sounds()
+        sound.play_click_mouse()
+        last_time = sound._last_time
+        index = pygame_menu.sound._SOUND_INDEX
+        self.assertEqual(sound._last_index, index[pygame_menu.sound.SOUND_TYPE_CLICK_MOUSE])
+        sound.play_click_mouse()  # Overlaps, not played but stored
+        self.assertEqual(sound._last_index, index[pygame_menu.sound.SOUND_TYPE_CLICK_MOUSE])
+        self.assertGreaterEqual(sound._last_time, last_time)
+        sound.play_error()
+        self.assertEqual(sound._last_index, index[pygame_menu.sound.SOUND_TYPE_ERROR])
+
     def test_sound_menu(self) -> None:
         """
         Test sounds in menu.